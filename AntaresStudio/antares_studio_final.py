@@ -7,7 +7,7 @@ Bu sürümde:
 - UI donmasını önlemek için QThread yerine QRunnable + QThreadPool kullanılır.
 - ESP32 /360_list ve /360_<session>_<i>.jpg endpointleriyle uyumludur.
 - Session ID (ESP32 millis) tarih gibi gösterilmez; "Session ID" olarak gösterilir.
-- Arkaplan temizlemede varsayılan "GrabCut (Hızlı)" + opsiyonel "rembg".
+- Arkaplan temizlemede varsayılan "GrabCut (Hızlı)" + opsiyonel "rembg" / "U²-Net (ONNX, Batch)".
 - Feature extractor dinamik: SIFT (varsa) / AKAZE / ORB.
 - Feature extraction joblib ile çok çekirdekli (varsa) çalışır; yoksa tek çekirdek.
 - Bellek temizliği (gc) ve büyük dizilerde kontrollü serbest bırakma.
@@ -18,22 +18,29 @@ Not: Photogrammetry / SfM burada “hafif” bir pipeline’dır. En yüksek kal
 from __future__ import annotations
 
 import gc
+import io
 import os
 import sys
 import json
 import math
+import hashlib
+import contextlib
+import functools
+import itertools
 import time
 import shutil
 import platform
+import threading
 import traceback
 import subprocess
+import multiprocessing
+from collections import deque
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from pathlib import Path
 
 import numpy as np
-import requests
 import cv2
 
 from PyQt6.QtCore import Qt, QObject, pyqtSignal, QRunnable, QThreadPool
@@ -47,29 +54,51 @@ from PyQt6.QtWidgets import (
 )
 
 # ========================= THEME (fallback safe) =========================
+# Fallback tema QSS'i modül seviyesinde bir kez üretilir (her çağrıda yeniden kurulmaz).
+_DARK_INDUSTRIAL_QSS = """
+    QWidget { background:#0b1220; color:#e5e7eb; font-family:Segoe UI; font-size:13px; }
+    QGroupBox, QLineEdit, QTextEdit, QListWidget, QComboBox, QSpinBox, QPushButton, QProgressBar, QTabBar::tab {
+        border:1px solid #223047;
+    }
+    QLineEdit, QTextEdit, QListWidget, QComboBox, QSpinBox, QProgressBar, QTabBar::tab, QPushButton:disabled {
+        background:#0f172a;
+    }
+    QGroupBox { border-radius:10px; margin-top:12px; padding:10px; }
+    QGroupBox::title { subcontrol-origin: margin; left: 12px; padding:0 6px; color:#93c5fd; }
+    QLineEdit, QTextEdit, QListWidget, QComboBox, QSpinBox {
+        border-radius:10px; padding:8px; selection-background-color:#2563eb;
+    }
+    QPushButton { background:#111827; border-radius:12px; padding:10px 12px; }
+    QPushButton:hover { background:#0b1a33; border-color:#2b3f5f; }
+    QPushButton:disabled { color:#64748b; }
+    QProgressBar { border-radius:10px; text-align:center; }
+    QProgressBar::chunk { background:#38bdf8; border-radius:10px; }
+    QTabBar::tab { border-bottom:none; padding:10px 12px; border-top-left-radius:10px; border-top-right-radius:10px; }
+    QTabBar::tab:selected { background:#111827; color:#93c5fd; }
+"""
+
+# Uygulamaya özgü widget kuralları (objectName ile); widget başına inline setStyleSheet yerine
+# tema ile birlikte tek seferde uygulanır.
+_APP_QSS = """
+QLabel#appHeader { color:#38bdf8; padding:14px; }
+QLabel#viewerInfo { padding:18px; }
+"""
+
 try:
     from ui.styles import apply_dark_industrial_theme  # repo içinde varsa kullan
 except Exception:
     def apply_dark_industrial_theme(app: QApplication) -> None:
-        qss = """
-        QWidget { background:#0b1220; color:#e5e7eb; font-family:Segoe UI; font-size:13px; }
-        QGroupBox { border:1px solid #223047; border-radius:10px; margin-top:12px; padding:10px; }
-        QGroupBox::title { subcontrol-origin: margin; left: 12px; padding:0 6px; color:#93c5fd; }
-        QLineEdit, QTextEdit, QListWidget, QComboBox, QSpinBox {
-            background:#0f172a; border:1px solid #223047; border-radius:10px; padding:8px;
-            selection-background-color:#2563eb;
-        }
-        QPushButton {
-            background:#111827; border:1px solid #223047; border-radius:12px; padding:10px 12px;
-        }
-        QPushButton:hover { background:#0b1a33; border-color:#2b3f5f; }
-        QPushButton:disabled { background:#0f172a; color:#64748b; }
-        QProgressBar { border:1px solid #223047; border-radius:10px; text-align:center; background:#0f172a; }
-        QProgressBar::chunk { background:#38bdf8; border-radius:10px; }
-        QTabBar::tab { background:#0f172a; border:1px solid #223047; border-bottom:none; padding:10px 12px; border-top-left-radius:10px; border-top-right-radius:10px; }
-        QTabBar::tab:selected { background:#111827; color:#93c5fd; }
-        """
-        app.setStyleSheet(qss)
+        # tema zaten uygulanmışsa (apply_app_styles eklemesiyle birlikte de olabilir) Qt'nin CSS
+        # parser'ını tekrar çalıştırma; aksi halde _APP_QSS kuralları da sessizce silinir
+        if app.styleSheet() not in (_DARK_INDUSTRIAL_QSS, _DARK_INDUSTRIAL_QSS + _APP_QSS):
+            app.setStyleSheet(_DARK_INDUSTRIAL_QSS)
+
+
+def apply_app_styles(app: QApplication) -> None:
+    """Temanın (repo'daki veya fallback) üstüne uygulamaya özgü kuralları bir kez ekler."""
+    qss = app.styleSheet()
+    if _APP_QSS not in qss:
+        app.setStyleSheet(qss + _APP_QSS)
 
 
 # ========================= Utilities =========================
@@ -110,6 +139,50 @@ def open_in_file_manager(path: str) -> None:
         pass
 
 
+@contextlib.contextmanager
+def gc_paused():
+    """
+    Yoğun nesne üreten döngülerde (knnMatch DMatch listeleri) döngüsel GC taramalarını durdurur.
+    Refcount belleği yine anında serbest bırakır; tam tarama işin sonunda bir kez yapılır.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+@functools.lru_cache(maxsize=None)
+def cuda_available() -> bool:
+    """OpenCV CUDA modülü derlenmiş ve en az bir GPU görünüyorsa True (pip opencv'de genelde False)."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def load_faiss():
+    """faiss (opsiyonel) import edilebiliyorsa modülü, yoksa None döndürür."""
+    try:
+        import faiss  # noqa
+        return faiss
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def faiss_gpu_available() -> bool:
+    """faiss-gpu kurulu ve en az bir GPU görünüyorsa True."""
+    faiss = load_faiss()
+    try:
+        return faiss is not None and faiss.get_num_gpus() > 0
+    except Exception:
+        return False
+
+
 def safe_float32(des: np.ndarray) -> np.ndarray:
     if des is None:
         return des
@@ -118,12 +191,22 @@ def safe_float32(des: np.ndarray) -> np.ndarray:
     return des
 
 
+def dmatch_to_idx(matches) -> np.ndarray:
+    """cv2.DMatch listesi -> (M,2) int32 [queryIdx, trainIdx]."""
+    if not matches:
+        return np.empty((0, 2), np.int32)
+    return np.array([(m.queryIdx, m.trainIdx) for m in matches], np.int32)
+
+
 # ========================= ESP32 Client =========================
 class Esp32Client:
     def __init__(self, ip: str, timeout_s: float = 6.0):
         self.ip = ip.strip()
         self.base = f"http://{self.ip}"
         self.timeout_s = timeout_s
+        # requests ilk istemci kurulurken yüklenir; viewer process'i ve GUI açılışı bu import'u ödemez
+        import requests
+
         self.session = requests.Session()
 
         # Basit retry
@@ -131,6 +214,8 @@ class Esp32Client:
         self.session.mount("http://", adapter)
 
     def ping(self) -> None:
+        import requests
+
         try:
             r = self.session.get(f"{self.base}/", timeout=self.timeout_s)
             if r.status_code != 200:
@@ -270,38 +355,105 @@ class BaseWorker(QRunnable):
 # ========================= Background Removal Strategies =========================
 class BackgroundRemovalStrategy:
     name: str = "base"
+    batch_size: int = 1  # >1 ise worker process_batch ile toplu çağırır
+    parallel_backend: Optional[str] = None  # joblib backend: "loky" (process) / "threading"; None -> sıralı
+    parallel_jobs: int = -1
+
+    def prepare(self) -> None:
+        """Ağır kurulum (model indirme/yükleme); worker thread'inde, işten önce bir kez çağrılır."""
+
     def process(self, img_path: str, out_path: str) -> None:
         raise NotImplementedError
 
+    def process_batch(self, img_paths: List[str], out_paths: List[str]) -> None:
+        for img_path, out_path in zip(img_paths, out_paths):
+            self.process(img_path, out_path)
+
 
 class GrabCutFast(BackgroundRemovalStrategy):
     name = "GrabCut (Hızlı)"
+    parallel_backend = "loky"  # tamamen CPU-bound, görüntüler bağımsız
+    margin: float = 0.08
+    iter_count: int = 3
+
+    def __init__(self):
+        # GMM model buffer'ları bir kez ayrılır, her görüntüde yeniden kullanılır
+        self._bgd_model = np.zeros((1, 65), np.float64)
+        self._fgd_model = np.zeros((1, 65), np.float64)
+
+    def _mask_cache_path(self, img: np.ndarray, out_path: str) -> str:
+        """
+        GrabCut sonucu (görüntü, rect, iter_count) için deterministik.
+        Maske, içerik hash'i + parametrelerle out_dir/.mask_cache altında saklanır.
+        """
+        key = hashlib.blake2b(img.tobytes(), digest_size=16).hexdigest()
+        key += f"_{self.margin}_{self.iter_count}"
+        cache_dir = ensure_dir(os.path.join(os.path.dirname(out_path), ".mask_cache"))
+        return os.path.join(cache_dir, f"{key}.png")
 
     def process(self, img_path: str, out_path: str) -> None:
         img = cv2.imread(img_path)
         if img is None:
             raise RuntimeError("Görüntü okunamadı")
-        h, w = img.shape[:2]
-        rect = (int(w * 0.08), int(h * 0.08), int(w * 0.84), int(h * 0.84))
-        mask = np.zeros((h, w), np.uint8)
-        bgdModel = np.zeros((1, 65), np.float64)
-        fgdModel = np.zeros((1, 65), np.float64)
-        cv2.grabCut(img, mask, rect, bgdModel, fgdModel, 3, cv2.GC_INIT_WITH_RECT)
-        mask2 = np.where((mask == 2) | (mask == 0), 0, 1).astype("uint8")
-        white = np.full_like(img, 255)
-        result = np.where(mask2[:, :, None] == 1, img, white)
-        cv2.imwrite(out_path, result)
-        del img, mask, bgdModel, fgdModel, mask2, white, result
-        gc.collect()
+        cache_path = self._mask_cache_path(img, out_path)
+        mask2 = cv2.imread(cache_path, cv2.IMREAD_GRAYSCALE) if os.path.exists(cache_path) else None
+        if mask2 is None or mask2.shape != img.shape[:2]:
+            h, w = img.shape[:2]
+            m = self.margin
+            rect = (int(w * m), int(h * m), int(w * (1 - 2 * m)), int(h * (1 - 2 * m)))
+            mask = np.zeros((h, w), np.uint8)
+            self._bgd_model.fill(0)
+            self._fgd_model.fill(0)
+            cv2.grabCut(img, mask, rect, self._bgd_model, self._fgd_model, self.iter_count, cv2.GC_INIT_WITH_RECT)
+            # GC_FGD=1 / GC_PR_FGD=3 tek sayılar: (mask & 1) * 255 -> tek geçiş, ekstra bool temp yok
+            mask2 = np.bitwise_and(mask, 1, out=mask)
+            mask2 *= 255
+            cv2.imwrite(cache_path, mask2)
+        # arkaplan beyaz: img | ~mask (yerinde, beyaz buffer ayırmadan)
+        np.bitwise_or(img, np.bitwise_not(mask2)[:, :, None], out=img)
+        cv2.imwrite(out_path, img)
+        del img, mask2
+
+
+class OtsuMaskRemove(BackgroundRemovalStrategy):
+    """
+    Düz fon (turntable) için çok hızlı maske: Otsu eşikleme + morfolojik kapama + en büyük bileşen.
+    GrabCut'tan kat kat hızlı; karmaşık arkaplanda GrabCut tercih edilmeli.
+    """
+    name = "Otsu (Çok Hızlı)"
+    parallel_backend = "threading"  # OpenCV GIL'i bırakır; process başlatma maliyetine değmez
+
+    def process(self, img_path: str, out_path: str) -> None:
+        img = cv2.imread(img_path)
+        if img is None:
+            raise RuntimeError("Görüntü okunamadı")
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        _, mask = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        # fon tarafı kenar piksellerinin çoğunluğu: kenarlar beyaz çıktıysa maskeyi ters çevir
+        border = np.concatenate([mask[0], mask[-1], mask[:, 0], mask[:, -1]])
+        if np.count_nonzero(border) * 2 > border.size:
+            cv2.bitwise_not(mask, dst=mask)
+        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel, dst=mask)
+        n, labels, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+        if n > 1:
+            largest = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+            mask = np.where(labels == largest, 255, 0).astype(np.uint8)
+        # arkaplan beyaz: img | ~mask (GrabCutFast ile aynı kompozisyon)
+        np.bitwise_or(img, np.bitwise_not(mask)[:, :, None], out=img)
+        cv2.imwrite(out_path, img)
+        del img, gray, mask, labels
 
 
 class RembgRemove(BackgroundRemovalStrategy):
     name = "rembg (AI)"
+    # ONNX session pickle edilemez: thread'ler tek session'ı paylaşır (ORT zaten çok thread'li)
+    parallel_backend = "threading"
+    parallel_jobs = 2
 
     def __init__(self):
         try:
-            from rembg import remove  # noqa
-            from PIL import Image  # noqa
+            from rembg import new_session, remove  # noqa
         except Exception as e:
             raise UserFacingError(
                 "rembg Yüklü Değil",
@@ -309,19 +461,141 @@ class RembgRemove(BackgroundRemovalStrategy):
                 hint="Kurulum: pip install rembg",
                 details=str(e),
             )
+        self._new_session = new_session
         self._remove = remove
-        self._Image = Image
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    def prepare(self) -> None:
+        # ONNX session bir kez kurulur (ilk kullanımda ~170 MB model indirilebilir; UI thread'inde değil)
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._new_session("u2net")
 
     def process(self, img_path: str, out_path: str) -> None:
-        inp = self._Image.open(img_path)
-        out = self._remove(inp)
-        out.save(out_path)
-        inp.close()
+        if self._session is None:
+            self.prepare()
+        img = cv2.imread(img_path)
+        if img is None:
+            raise RuntimeError("Görüntü okunamadı")
+        # ndarray in -> ndarray (RGBA) out: PIL open/save ve PNG yeniden decode yok
+        rgba = self._remove(cv2.cvtColor(img, cv2.COLOR_BGR2RGB), session=self._session)
+        cv2.imwrite(out_path, cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGRA))
+        del img, rgba
+
+
+class U2NetRemove(BackgroundRemovalStrategy):
+    """
+    U²-Net (u2netp) ONNX modeli ile salient-object maskesi.
+    Görüntüler tek tek değil, batch halinde tek bir sess.run ile işlenir (GPU varsa CUDA).
+    Model rembg'nin indirdiği konumdan okunur: $U2NET_HOME veya ~/.u2net/u2netp.onnx
+    """
+    name = "U²-Net (ONNX, Batch)"
+    batch_size = 8
+    input_size = 320
+    mean = np.array([0.485, 0.456, 0.406], np.float32)
+    std = np.array([0.229, 0.224, 0.225], np.float32)
+
+    def __init__(self):
+        try:
+            import onnxruntime as ort
+        except Exception as e:
+            raise UserFacingError(
+                "onnxruntime Yüklü Değil",
+                "U²-Net arkaplan temizleme için 'onnxruntime' bulunamadı.",
+                hint="Kurulum: pip install onnxruntime (GPU için onnxruntime-gpu)",
+                details=str(e),
+            )
+        model_dir = os.getenv("U2NET_HOME") or os.path.join(os.path.expanduser("~"), ".u2net")
+        model_path = os.path.join(model_dir, "u2netp.onnx")
+        if not os.path.exists(model_path):
+            raise UserFacingError(
+                "U²-Net Modeli Bulunamadı",
+                f"Model dosyası yok: {model_path}",
+                hint="rembg ile bir kez 'u2netp' modeli indir veya u2netp.onnx dosyasını bu klasöre kopyala.",
+            )
+        self._ort = ort
+        self._model_path = model_path
+        self._sess = None
+        self._input_name = ""
+
+    def prepare(self) -> None:
+        # session kurulumu (ve CPU'da int8 üretimi) worker thread'inde yapılır; UI kilitlenmez
+        if self._sess is not None:
+            return
+        ort = self._ort
+        model_path = self._model_path
+        providers = [p for p in ("CUDAExecutionProvider", "CPUExecutionProvider") if p in ort.get_available_providers()]
+        if "CUDAExecutionProvider" not in providers:
+            # CPU'da int8 (dinamik quantize) model ~3-4x hızlı; CUDA int8 Conv desteklemediği için sadece CPU'da.
+            model_path = self._int8_model(model_path)
+
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        opts.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+        self._sess = ort.InferenceSession(model_path, sess_options=opts, providers=providers)
+        inp = self._sess.get_inputs()[0]
+        self._input_name = inp.name
+        # batch boyutu sabit export edilmişse (örn. [1,3,320,320]) toplu run çalışmaz -> tek tek
+        if isinstance(inp.shape[0], int):
+            self.batch_size = 1
+
+    @staticmethod
+    def _int8_model(model_path: str) -> str:
+        """
+        u2netp.int8.onnx varsa onu döndürür; yoksa bir kez quantize_dynamic ile üretir.
+        Üretilemezse (quantization modülü yok / yazma izni yok) FP32 model kullanılır.
+        """
+        int8_path = os.path.splitext(model_path)[0] + ".int8.onnx"
+        if os.path.exists(int8_path):
+            return int8_path
+        # geçici isme yaz + os.replace: yarıda kalan bir çalışma bozuk int8 dosyası bırakmaz
+        tmp_path = f"{os.path.splitext(model_path)[0]}.int8.{os.getpid()}.tmp.onnx"
         try:
-            out.close()
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+            quantize_dynamic(model_path, tmp_path, weight_type=QuantType.QInt8)
+            os.replace(tmp_path, int8_path)
+            return int8_path
         except Exception:
-            pass
-        gc.collect()
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            return model_path
+
+    def process(self, img_path: str, out_path: str) -> None:
+        self.process_batch([img_path], [out_path])
+
+    def process_batch(self, img_paths: List[str], out_paths: List[str]) -> None:
+        if self._sess is None:
+            self.prepare()
+        if len(img_paths) > self.batch_size:
+            for start in range(0, len(img_paths), self.batch_size):
+                end = start + self.batch_size
+                self.process_batch(img_paths[start:end], out_paths[start:end])
+            return
+        imgs = []
+        for p in img_paths:
+            img = cv2.imread(p)
+            if img is None:
+                raise RuntimeError(f"Görüntü okunamadı: {os.path.basename(p)}")
+            imgs.append(img)
+
+        s = self.input_size
+        # (N,3,S,S) RGB [0,1] -> ImageNet normalize
+        blob = cv2.dnn.blobFromImages(imgs, scalefactor=1.0 / 255.0, size=(s, s), swapRB=True, crop=False)
+        blob -= self.mean[None, :, None, None]
+        blob /= self.std[None, :, None, None]
+        pred = self._sess.run(None, {self._input_name: blob})[0][:, 0]  # (N,S,S)
+
+        for img, alpha, out_path in zip(imgs, pred, out_paths):
+            lo, hi = float(alpha.min()), float(alpha.max())
+            alpha = (alpha - lo) / (hi - lo + 1e-8)
+            h, w = img.shape[:2]
+            fg = cv2.resize(alpha, (w, h), interpolation=cv2.INTER_LINEAR) > 0.5
+            mask = fg.view(np.uint8) * np.uint8(255)
+            # arkaplan beyaz: img | ~mask (GrabCutFast/OtsuMaskRemove ile aynı yerinde kompozisyon)
+            np.bitwise_or(img, np.bitwise_not(mask)[:, :, None], out=img)
+            cv2.imwrite(out_path, img)
+        del imgs, blob, pred
 
 
 class BackgroundRemoveWorker(BaseWorker):
@@ -334,28 +608,83 @@ class BackgroundRemoveWorker(BaseWorker):
     def run(self) -> None:
         try:
             total = len(self.image_paths)
-            processed: List[str] = []
             self.signals.log.emit(f"🧼 Arkaplan temizleme: {self.strategy.name}")
-            for i, p in enumerate(self.image_paths):
-                if self.is_cancelled():
-                    break
+            try:
+                self.strategy.prepare()
+            except Exception as e:
+                reason = f"{e.title}: {e.hint}" if isinstance(e, UserFacingError) else str(e)
+                self.signals.log.emit(f"⚠️ {self.strategy.name} hazırlanamadı -> GrabCut’a düşüyorum. ({reason})")
+                self.strategy = GrabCutFast()
+            out_paths = []
+            for p in self.image_paths:
                 base = os.path.splitext(os.path.basename(p))[0]
-                out_path = os.path.join(self.out_dir, f"{base}_clean.png")
-                self.signals.log.emit(f"[{i+1}/{total}] {os.path.basename(p)}")
-                self.strategy.process(p, out_path)
-                processed.append(out_path)
-                self.signals.progress.emit(int((i + 1) * 100 / total))
+                out_paths.append(os.path.join(self.out_dir, f"{base}_clean.png"))
+
+            processed = None
+            if self.strategy.parallel_backend and total > 1:
+                processed = self._run_parallel(out_paths)
+            if processed is None:
+                processed = self._run_batched(out_paths)
             self.signals.result.emit(processed)
         except UserFacingError as e:
             self.signals.error.emit(e.title, e.message, e.details or e.hint)
         except Exception as e:
             self.signals.error.emit("Arkaplan Temizleme Hatası", str(e), traceback.format_exc())
         finally:
+            # görüntü başına değil, iş bitince bir kez
+            gc.collect()
             self.signals.finished.emit()
 
+    def _run_batched(self, out_paths: List[str]) -> List[str]:
+        total = len(self.image_paths)
+        processed: List[str] = []
+        bs = max(1, int(self.strategy.batch_size))
+        for start in range(0, total, bs):
+            if self.is_cancelled():
+                break
+            batch = self.image_paths[start:start + bs]
+            for i, p in enumerate(batch, start=start):
+                self.signals.log.emit(f"[{i+1}/{total}] {os.path.basename(p)}")
+            self.strategy.process_batch(batch, out_paths[start:start + bs])
+            processed.extend(out_paths[start:start + bs])
+            self.signals.progress.emit(int(len(processed) * 100 / total))
+        return processed
+
+    def _run_parallel(self, out_paths: List[str]) -> Optional[List[str]]:
+        """
+        Görüntü başına bağımsız iş: joblib ile çok çekirdek.
+        loky -> strateji worker process'lere pickle ile kopyalanır; threading -> tek instance paylaşılır.
+        joblib yoksa veya process havuzu kurulamaz/çökerse None döner (sıralı yola düşülür).
+        """
+        try:
+            from joblib import Parallel, delayed
+        except Exception:
+            return None
+        import pickle
+        from concurrent.futures import BrokenExecutor
+
+        total = len(self.image_paths)
+        self.signals.log.emit(f"⚡ Paralel ({self.strategy.parallel_backend}, n_jobs={self.strategy.parallel_jobs})")
+        par = Parallel(n_jobs=self.strategy.parallel_jobs, backend=self.strategy.parallel_backend, return_as="generator")
+        jobs = (delayed(self.strategy.process)(p, o) for p, o in zip(self.image_paths, out_paths))
+        processed: List[str] = []
+        try:
+            for i, _ in enumerate(par(jobs)):
+                processed.append(out_paths[i])
+                self.signals.log.emit(f"[{i+1}/{total}] {os.path.basename(self.image_paths[i])}")
+                self.signals.progress.emit(int((i + 1) * 100 / total))
+                if self.is_cancelled():
+                    break
+        except (BrokenExecutor, pickle.PicklingError, OSError) as e:
+            # loky worker öldü / havuz kurulamadı (örn. frozen build): görüntü hatası değil, executor hatası
+            first_line = (str(e).splitlines() or [""])[0]
+            self.signals.log.emit(f"⚠️ Paralel çalıştırma başarısız ({type(e).__name__}: {first_line}) -> sıralı moda geçiyorum.")
+            return None
+        return processed
+
 
 # ========================= Feature Extraction Strategies =========================
-@dataclass
+@dataclass(slots=True)
 class FeaturePack:
     path: str
     xy: np.ndarray          # (N,2) float32
@@ -377,7 +706,8 @@ class FeatureExtractorStrategy:
         kps, des = detector.detectAndCompute(gray, None)
         if des is None or kps is None or len(kps) == 0:
             return np.empty((0, 2), np.float32), np.empty((0, 1), np.float32)
-        xy = np.array([kp.pt for kp in kps], dtype=np.float32)
+        # KeyPoint nesneleri burada bırakılır; sadece (N,2) float32 SoA dizi taşınır
+        xy = cv2.KeyPoint_convert(kps).reshape(-1, 2).astype(np.float32, copy=False)
         return xy, des
 
 
@@ -405,6 +735,21 @@ class ORBExtractor(FeatureExtractorStrategy):
     def create(self, nfeatures: int):
         return cv2.ORB_create(nfeatures=nfeatures)
 
+    def detect(self, img_bgr: np.ndarray, nfeatures: int) -> Tuple[np.ndarray, np.ndarray]:
+        if not cuda_available():
+            return super().detect(img_bgr, nfeatures)
+        # CUDA ORB: gray GPU'ya bir kez yüklenir, sadece keypoint + descriptor geri indirilir
+        gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+        gpu_gray = cv2.cuda_GpuMat()
+        gpu_gray.upload(gray)
+        orb = cv2.cuda.ORB_create(nfeatures=nfeatures)
+        kps_gpu, des_gpu = orb.detectAndComputeAsync(gpu_gray, None)
+        kps = orb.convert(kps_gpu)
+        if des_gpu is None or des_gpu.empty() or kps is None or len(kps) == 0:
+            return np.empty((0, 2), np.float32), np.empty((0, 1), np.float32)
+        xy = cv2.KeyPoint_convert(kps).reshape(-1, 2).astype(np.float32, copy=False)
+        return xy, des_gpu.download()
+
 
 def choose_feature_strategy(mode: str) -> FeatureExtractorStrategy:
     """
@@ -429,6 +774,12 @@ def choose_feature_strategy(mode: str) -> FeatureExtractorStrategy:
 
 
 # ========================= Reconstruction Worker =========================
+# OpenCV 4.5+: MAGSAC++ (USAC) klasik RANSAC'tan çok daha az hipotezle yakınsar; yoksa RANSAC.
+ESSENTIAL_METHOD = getattr(cv2, "USAC_MAGSAC", cv2.RANSAC)
+# Binary descriptor'larda bu sayının altında brute-force, üstünde FLANN LSH daha hızlı
+BF_MAX_FEATURES = 500
+
+
 class ReconstructionWorker(BaseWorker):
     def __init__(
         self,
@@ -439,6 +790,8 @@ class ReconstructionWorker(BaseWorker):
         min_matches: int,
         wrap_match: bool = True,
         use_joblib: bool = True,
+        binary_ply: bool = True,
+        n_cv_threads: Optional[int] = None,
     ):
         super().__init__()
         self.image_paths = image_paths
@@ -448,8 +801,18 @@ class ReconstructionWorker(BaseWorker):
         self.min_matches = int(min_matches)
         self.wrap_match = bool(wrap_match)
         self.use_joblib = bool(use_joblib)
+        self.binary_ply = bool(binary_ply)
+        self._tls = threading.local()  # thread başına matcher cache
+        # OpenCV iç thread sayısı. Görüntüler/çiftler zaten bizim thread'lerimizde paralel;
+        # OpenCV'nin de tüm çekirdekleri açması oversubscription (cache/TLB çekişmesi) yapar.
+        # None -> joblib açıkken 1, kapalıyken min(4, cpu).
+        if n_cv_threads is None:
+            n_cv_threads = 1 if self.use_joblib else min(4, os.cpu_count() or 1)
+        self.n_cv_threads = max(1, int(n_cv_threads))
 
     def run(self) -> None:
+        prev_cv_threads = cv2.getNumThreads()
+        cv2.setNumThreads(self.n_cv_threads)
         try:
             self.signals.log.emit("=" * 72)
             self.signals.log.emit("🏗️ 3D Pipeline başlıyor (Hafif SfM)")
@@ -463,13 +826,11 @@ class ReconstructionWorker(BaseWorker):
                     hint="ESP32’den indirme sırasında eksik fotoğraf geliyorsa /360_list ve SD kartı kontrol et.",
                 )
 
-            # 1) Load images (light validation)
-            imgs = []
-            for p in self.image_paths:
-                img = cv2.imread(p)
-                if img is None:
-                    continue
-                imgs.append((p, img))
+            # 1) Load images + 2) Feature extraction (decode arka planda, feature ile üst üste)
+            strat = choose_feature_strategy(self.mode)
+            self.signals.log.emit(f"🔍 Feature: {strat.name} | mod={self.mode} | nfeatures≈{self.nfeatures}")
+            self.signals.progress.emit(10)
+            imgs, feats = self._extract_features(self._iter_images(), strat)
             if len(imgs) < 8:
                 raise UserFacingError(
                     "Görüntü Okuma Hatası",
@@ -477,12 +838,6 @@ class ReconstructionWorker(BaseWorker):
                     hint="Dosyaların bozulmadığını ve path’lerin doğru olduğunu kontrol et.",
                 )
             self.signals.log.emit(f"📸 Okunan görüntü: {len(imgs)}/{len(self.image_paths)}")
-            self.signals.progress.emit(10)
-
-            # 2) Feature extraction
-            strat = choose_feature_strategy(self.mode)
-            self.signals.log.emit(f"🔍 Feature: {strat.name} | mod={self.mode} | nfeatures≈{self.nfeatures}")
-            feats = self._extract_features(imgs, strat)
             if sum(fp.xy.shape[0] for fp in feats) == 0:
                 raise UserFacingError(
                     "Feature Bulunamadı",
@@ -533,87 +888,204 @@ class ReconstructionWorker(BaseWorker):
             self.signals.error.emit("3D Pipeline Hatası", str(e), traceback.format_exc())
         finally:
             # Cleanup
+            cv2.setNumThreads(prev_cv_threads)
             gc.collect()
             self.signals.finished.emit()
 
     # ---------------- internal steps ----------------
-    def _extract_features(self, imgs: List[Tuple[str, np.ndarray]], strat: FeatureExtractorStrategy) -> List[FeaturePack]:
-        paths = [p for p, _ in imgs]
+    def _iter_images(self, prefetch: int = 8) -> Iterator[Tuple[str, Optional[np.ndarray]]]:
+        """
+        Görüntüleri arka planda (thread pool) decode eder, sırayı koruyarak verir.
+        En fazla `prefetch` görüntü önden okunur; feature adımı yavaşsa decode bekler.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        paths = iter(self.image_paths)
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            pending = deque((p, ex.submit(cv2.imread, p)) for p in itertools.islice(paths, prefetch))
+            while pending:
+                if self.is_cancelled():
+                    break
+                p, fut = pending.popleft()
+                nxt = next(paths, None)
+                if nxt is not None:
+                    pending.append((nxt, ex.submit(cv2.imread, nxt)))
+                yield p, fut.result()
+
+    def _extract_features(
+        self,
+        frames: Iterable[Tuple[str, Optional[np.ndarray]]],
+        strat: FeatureExtractorStrategy,
+    ) -> Tuple[List[Tuple[str, np.ndarray]], List[FeaturePack]]:
         self.signals.log.emit(f"🧠 Feature çıkarımı (joblib={'ON' if self.use_joblib else 'OFF'})")
 
-        def _one(path: str) -> FeaturePack:
-            img = cv2.imread(path)
+        cache_dir = ensure_dir(os.path.join(self.out_dir, ".feature_cache"))
+
+        def _one(path: str, img: Optional[np.ndarray]) -> Tuple[str, Optional[np.ndarray], Optional[FeaturePack]]:
             if img is None:
-                return FeaturePack(path, np.empty((0, 2), np.float32), np.empty((0, 1), np.float32), strat.norm, strat.name)
+                return path, None, None
+            # Disk cache: aynı görüntü + aynı extractor/nfeatures -> detectAndCompute atlanır
+            key = hashlib.blake2b(img.tobytes(), digest_size=16).hexdigest()
+            cache_path = os.path.join(cache_dir, f"{key}_{strat.name}_{self.nfeatures}.npz")
+            try:
+                with np.load(cache_path) as z:
+                    return path, img, FeaturePack(path, z["xy"], z["des"], strat.norm, strat.name)
+            except Exception:
+                pass
             xy, des = strat.detect(img, self.nfeatures)
             # SIFT des float32, ORB/AKAZE uint8
             if strat.norm == cv2.NORM_L2:
                 des = safe_float32(des)
-            del img
-            return FeaturePack(path, xy, des, strat.norm, strat.name)
+            try:
+                np.savez(cache_path, xy=xy, des=des)
+            except Exception:
+                pass
+            return path, img, FeaturePack(path, xy, des, strat.norm, strat.name)
 
-        feats: List[FeaturePack] = []
+        out = None
         if self.use_joblib:
             try:
                 from joblib import Parallel, delayed
-                # Lokalde çok core açmak ESP32 download değil CPU step; iyi.
-                feats = Parallel(n_jobs=-1, prefer="threads")(delayed(_one)(p) for p in paths)
             except Exception:
-                feats = [_one(p) for p in paths]
-        else:
-            feats = [_one(p) for p in paths]
+                Parallel = None
+            if Parallel is not None:
+                # Lokalde çok core açmak ESP32 download değil CPU step; iyi.
+                # Generator tembel tüketilir: decode edilen her görüntü hemen bir worker'a gider.
+                out = Parallel(n_jobs=-1, prefer="threads")(delayed(_one)(p, img) for p, img in frames)
+        if out is None:
+            out = [_one(p, img) for p, img in frames]
+
+        imgs: List[Tuple[str, np.ndarray]] = []
+        feats: List[FeaturePack] = []
+        for path, img, fp in out:
+            if img is None:
+                self.signals.log.emit(f"  ✗ {os.path.basename(path)} okunamadı")
+                continue
+            imgs.append((path, img))
+            feats.append(fp)
 
         # log özet
         for i, fp in enumerate(feats):
             self.signals.log.emit(f"  ✓ [{i+1}/{len(feats)}] {os.path.basename(fp.path)} -> {fp.xy.shape[0]} feat")
             if self.is_cancelled():
                 break
-        return feats
+        return imgs, feats
 
-    def _make_matcher(self, norm: int, algo: str):
-        # SIFT -> FLANN (KDTree) , ORB/AKAZE -> BF Hamming
+    def _make_matcher(self, norm: int, algo: str, n_features: int):
+        """
+        knnMatch(k=2) + Lowe ratio için matcher döndürür.
+        Matcher'lar thread başına bir kez oluşturulur (FlannBasedMatcher knnMatch içinde index kurar,
+        thread'ler arası paylaşılamaz).
+        """
+        # SIFT -> FLANN (KDTree)
+        # ORB/AKAZE -> çok feature'da FLANN LSH (O(N log N)); az feature'da BF Hamming knn daha hızlı.
+        # (BF crossCheck denendi: 3k ORB'da knn+ratio'dan ~2-3x yavaş ve daha gevşek eşleşme veriyor.)
         if norm == cv2.NORM_L2:
-            index_params = dict(algorithm=1, trees=5)
-            search_params = dict(checks=50)
-            return cv2.FlannBasedMatcher(index_params, search_params), True
-        return cv2.BFMatcher(norm, crossCheck=False), False
+            kind = "flann_kd"
+        elif n_features >= BF_MAX_FEATURES and not (algo == "ORB" and cuda_available()):
+            # GPU matcher sadece ORB için var (_match_cross_cuda); AKAZE CUDA build'inde de LSH kullanır
+            kind = "flann_lsh"
+        else:
+            kind = "bf_knn"
+
+        cache = getattr(self._tls, "matchers", None)
+        if cache is None:
+            cache = self._tls.matchers = {}
+        if kind not in cache:
+            if kind == "flann_kd":
+                cache[kind] = cv2.FlannBasedMatcher(dict(algorithm=1, trees=5), dict(checks=50))
+            elif kind == "flann_lsh":
+                index_params = dict(algorithm=6, table_number=6, key_size=12, multi_probe_level=1)
+                cache[kind] = cv2.FlannBasedMatcher(index_params, dict(checks=50))
+            else:
+                cache[kind] = cv2.BFMatcher(norm, crossCheck=False)
+        return cache[kind]
 
-    def _match_pair(self, a: FeaturePack, b: FeaturePack) -> List[cv2.DMatch]:
+    def _match_pair(self, a: FeaturePack, b: FeaturePack) -> np.ndarray:
+        """(M,2) int32 [queryIdx, trainIdx] döndürür; DMatch nesneleri pipeline'a taşınmaz."""
         if a.des is None or b.des is None or len(a.des) == 0 or len(b.des) == 0:
-            return []
-        matcher, _ = self._make_matcher(a.norm, a.algo)
+            return np.empty((0, 2), np.int32)
+        if a.algo == "ORB" and cuda_available():
+            return self._match_cross_cuda(a.des, b.des)
+        matcher = self._make_matcher(a.norm, a.algo, min(len(a.des), len(b.des)))
         # FLANN requires float32
         des1, des2 = a.des, b.des
         if a.norm == cv2.NORM_L2:
             des1 = safe_float32(des1)
             des2 = safe_float32(des2)
-        knn = matcher.knnMatch(des1, des2, k=2)
-        good: List[cv2.DMatch] = []
-        for pair in knn:
-            if len(pair) < 2:
-                continue
-            m, n = pair[0], pair[1]
-            if m.distance < 0.75 * n.distance:
-                good.append(m)
-        return good
-
-    def _match_adjacent(self, feats: List[FeaturePack]) -> List[Tuple[int, int, List[cv2.DMatch]]]:
+        if a.norm == cv2.NORM_L2:
+            faiss = load_faiss()
+            if faiss is not None:
+                return self._match_ratio_faiss(faiss, des1, des2)
+            if cuda_available():
+                # GPU brute-force L2 (CUDA'lı OpenCV build'inde)
+                matcher = cv2.cuda.DescriptorMatcher_createBFMatcher(cv2.NORM_L2)
+                g1, g2 = cv2.cuda_GpuMat(), cv2.cuda_GpuMat()
+                g1.upload(des1)
+                g2.upload(des2)
+                des1, des2 = g1, g2
+        knn = [pair for pair in matcher.knnMatch(des1, des2, k=2) if len(pair) >= 2]
+        if not knn:
+            return np.empty((0, 2), np.int32)
+        # mesafe + index'ler tek geçişte dizilere; Lowe ratio tek vektörel karşılaştırma
+        d = np.array([(m.distance, n.distance) for m, n, *_ in knn], np.float32)
+        idx = np.array([(m.queryIdx, m.trainIdx) for m, *_ in knn], np.int32)
+        return idx[d[:, 0] < 0.75 * d[:, 1]]
+
+    def _match_ratio_faiss(self, faiss, des1: np.ndarray, des2: np.ndarray) -> np.ndarray:
+        """SIFT için exact k-NN (FAISS IndexFlatL2, GPU varsa GPU); DMatch nesnesi hiç oluşmaz."""
+        index = faiss.IndexFlatL2(des2.shape[1])
+        if faiss_gpu_available():
+            # StandardGpuResources thread-safe değil: eşleştirme thread'i başına bir tane (thread-local)
+            res = getattr(self._tls, "faiss_res", None)
+            if res is None:
+                res = self._tls.faiss_res = faiss.StandardGpuResources()
+            index = faiss.index_cpu_to_gpu(res, 0, index)
+        index.add(np.ascontiguousarray(des2))
+        d2, nn = index.search(np.ascontiguousarray(des1), 2)
+        # FAISS kare mesafe döndürür: d0 < 0.75*d1  <=>  d0² < 0.5625*d1²
+        keep = (nn[:, 1] >= 0) & (d2[:, 0] < (0.75 ** 2) * d2[:, 1])
+        q = np.nonzero(keep)[0].astype(np.int32)
+        return np.stack([q, nn[keep, 0].astype(np.int32)], axis=1)
+
+    def _match_cross_cuda(self, des1: np.ndarray, des2: np.ndarray) -> np.ndarray:
+        """GPU Hamming brute-force; CUDA matcher crossCheck desteklemediği için iki yönlü eşleşip karşılıklılar tutulur."""
+        matcher = cv2.cuda.DescriptorMatcher_createBFMatcher(cv2.NORM_HAMMING)
+        d1, d2 = cv2.cuda_GpuMat(), cv2.cuda_GpuMat()
+        d1.upload(des1)
+        d2.upload(des2)
+        fwd = dmatch_to_idx(matcher.match(d1, d2))
+        back = dmatch_to_idx(matcher.match(d2, d1))
+        # karşılıklı: back[fwd.train] == fwd.query
+        lookup = np.full(len(des2), -1, np.int32)
+        lookup[back[:, 0]] = back[:, 1]
+        return fwd[lookup[fwd[:, 1]] == fwd[:, 0]]
+
+    def _match_adjacent(self, feats: List[FeaturePack]) -> List[Tuple[int, int, np.ndarray]]:
         self.signals.log.emit(f"🔗 Eşleştirme: komşu çiftler | min_matches={self.min_matches} | wrap={self.wrap_match}")
-        matches: List[Tuple[int, int, List[cv2.DMatch]]] = []
+        matches: List[Tuple[int, int, np.ndarray]] = []
         n = len(feats)
         pairs = [(i, i + 1) for i in range(n - 1)]
         if self.wrap_match and n >= 3:
             pairs.append((n - 1, 0))
 
-        for idx, (i, j) in enumerate(pairs):
-            if self.is_cancelled():
-                break
-            good = self._match_pair(feats[i], feats[j])
-            if len(good) >= self.min_matches:
-                matches.append((i, j, good))
-                self.signals.log.emit(f"  ✓ [{i}]—[{j}] : {len(good)} match")
-            else:
-                self.signals.log.emit(f"  ✗ [{i}]—[{j}] : {len(good)} (yetersiz)")
+        # Çiftler birbirinden bağımsız: küçük bir thread pool'da eşleştir (OpenCV GIL'i bırakır),
+        # sonuçları sırayla tüket -> log sırası ve matches sırası değişmez.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with gc_paused(), ThreadPoolExecutor(max_workers=3) as ex:
+            futs = [ex.submit(self._match_pair, feats[i], feats[j]) for i, j in pairs]
+            for (i, j), fut in zip(pairs, futs):
+                if self.is_cancelled():
+                    for f in futs:
+                        f.cancel()
+                    break
+                good = fut.result()
+                if len(good) >= self.min_matches:
+                    matches.append((i, j, good))
+                    self.signals.log.emit(f"  ✓ [{i}]—[{j}] : {len(good)} match")
+                else:
+                    self.signals.log.emit(f"  ✗ [{i}]—[{j}] : {len(good)} (yetersiz)")
         self.signals.log.emit(f"✅ Eşleşen çift: {len(matches)}/{len(pairs)}")
         return matches
 
@@ -621,7 +1093,7 @@ class ReconstructionWorker(BaseWorker):
         self,
         imgs: List[Tuple[str, np.ndarray]],
         feats: List[FeaturePack],
-        matches: List[Tuple[int, int, List[cv2.DMatch]]],
+        matches: List[Tuple[int, int, np.ndarray]],
     ) -> Tuple[Dict[int, Tuple[np.ndarray, np.ndarray]], np.ndarray]:
         # K: basit pinhole
         first_img = imgs[0][1]
@@ -635,7 +1107,7 @@ class ReconstructionWorker(BaseWorker):
         poses: Dict[int, Tuple[np.ndarray, np.ndarray]] = {0: (np.eye(3), np.zeros((3, 1), np.float64))}
 
         # create quick lookup for adjacent matches
-        match_map: Dict[Tuple[int, int], List[cv2.DMatch]] = {(i, j): ms for i, j, ms in matches}
+        match_map: Dict[Tuple[int, int], np.ndarray] = {(i, j): ms for i, j, ms in matches}
 
         # forward chain 0->1->2...
         for j in range(1, len(feats)):
@@ -644,10 +1116,10 @@ class ReconstructionWorker(BaseWorker):
             if key not in match_map:
                 continue
             ms = match_map[key]
-            pts1 = np.float32([feats[i].xy[m.queryIdx] for m in ms])
-            pts2 = np.float32([feats[j].xy[m.trainIdx] for m in ms])
+            pts1 = feats[i].xy[ms[:, 0]]
+            pts2 = feats[j].xy[ms[:, 1]]
 
-            E, mask = cv2.findEssentialMat(pts1, pts2, K, method=cv2.RANSAC, prob=0.999, threshold=2.0)
+            E, mask = cv2.findEssentialMat(pts1, pts2, K, method=ESSENTIAL_METHOD, prob=0.999, threshold=2.0)
             if E is None:
                 continue
             _, R_rel, t_rel, _ = cv2.recoverPose(E, pts1, pts2, K)
@@ -667,51 +1139,64 @@ class ReconstructionWorker(BaseWorker):
         self,
         imgs: List[Tuple[str, np.ndarray]],
         feats: List[FeaturePack],
-        matches: List[Tuple[int, int, List[cv2.DMatch]]],
+        matches: List[Tuple[int, int, np.ndarray]],
         poses: Dict[int, Tuple[np.ndarray, np.ndarray]],
         K: np.ndarray,
     ) -> Tuple[np.ndarray, np.ndarray]:
         pts_all = []
         col_all = []
 
+        # dehomojen noktalar için çiftler arası tekrar kullanılan float32 çıktı tamponu
+        X_buf = np.empty((0, 3), np.float32)
+
+        # Projeksiyon matrisi poz başına bir kez: her kare iki çiftte (sol/sağ) kullanılıyor
+        proj: Dict[int, np.ndarray] = {}
+        for idx, (R, t) in poses.items():
+            P = np.empty((3, 4), np.float64)
+            np.matmul(K, R, out=P[:, :3])
+            np.matmul(K, t, out=P[:, 3:])
+            proj[idx] = P
+
         for (i, j, ms) in matches:
             if i not in poses or j not in poses:
                 continue
-            R_i, t_i = poses[i]
-            R_j, t_j = poses[j]
-            P1 = K @ np.hstack([R_i, t_i])
-            P2 = K @ np.hstack([R_j, t_j])
+            P1 = proj[i]
+            P2 = proj[j]
 
-            pts1 = np.float32([feats[i].xy[m.queryIdx] for m in ms])
-            pts2 = np.float32([feats[j].xy[m.trainIdx] for m in ms])
+            pts1 = feats[i].xy[ms[:, 0]]
+            pts2 = feats[j].xy[ms[:, 1]]
 
             X4 = cv2.triangulatePoints(P1, P2, pts1.T, pts2.T)  # 4xN
-            X = (X4[:3] / (X4[3] + 1e-9)).T  # Nx3
-
-            # color sample from i image
+            # homojen bölme: tek geçiş, doğrudan float32 çıktıya; NaN/inf sadece w≈0'dan gelir
+            w = X4[3]
+            ok = np.abs(w) > 1e-9
+            n = X4.shape[1]
+            if n > X_buf.shape[0]:
+                X_buf = np.empty((max(n, 1024), 3), np.float32)
+            X = X_buf[:n]  # pts_all'a X[ok] (kopya) gider, tampon güvenle tekrar kullanılır
+            with np.errstate(divide="ignore", invalid="ignore"):
+                np.divide(X4[:3].T, w[:, None], out=X, where=ok[:, None], casting="same_kind")
+
+            # color sample from i image (fancy indexing; görüntü dışı -> gri)
             img_i = imgs[i][1]
-            for k, uv in enumerate(pts1):
-                x, y = int(uv[0]), int(uv[1])
-                if 0 <= x < img_i.shape[1] and 0 <= y < img_i.shape[0]:
-                    bgr = img_i[y, x].astype(np.float32) / 255.0
-                    rgb = bgr[::-1]
-                else:
-                    rgb = np.array([0.8, 0.8, 0.8], np.float32)
-                pts_all.append(X[k])
-                col_all.append(rgb)
-
-        pts = np.asarray(pts_all, dtype=np.float64)
-        cols = np.asarray(col_all, dtype=np.float64)
-
-        # Basit filtre: NaN/inf temizle
-        m = np.isfinite(pts).all(axis=1)
-        pts = pts[m]
-        cols = cols[m]
+            xs = pts1[:, 0].astype(np.int32)
+            ys = pts1[:, 1].astype(np.int32)
+            inside = (xs >= 0) & (xs < img_i.shape[1]) & (ys >= 0) & (ys < img_i.shape[0])
+            rgb = np.full((pts1.shape[0], 3), 0.8, np.float32)
+            rgb[inside] = img_i[ys[inside], xs[inside], ::-1] / np.float32(255.0)
+            pts_all.append(X[ok])
+            col_all.append(rgb[ok])
+
+        # render/export için FP64 hassasiyeti gereksiz
+        pts = np.concatenate(pts_all) if pts_all else np.empty((0, 3), np.float32)
+        cols = np.concatenate(col_all) if col_all else np.empty((0, 3), np.float32)
 
         # Aşırı uçları kıs
         if pts.shape[0] > 0:
             center = np.median(pts, axis=0)
-            dist = np.linalg.norm(pts - center, axis=1)
+            d = pts - center
+            # (N,3) satır normu: np.linalg.norm dispatch'i yerine tek einsum + sqrt
+            dist = np.sqrt(np.einsum("ij,ij->i", d, d))
             keep = dist < np.quantile(dist, 0.98)
             pts = pts[keep]
             cols = cols[keep]
@@ -729,9 +1214,10 @@ class ReconstructionWorker(BaseWorker):
             import open3d as o3d  # noqa
 
             pcd = o3d.geometry.PointCloud()
-            pcd.points = o3d.utility.Vector3dVector(pts)
+            # Open3D Vector3dVector float64 ister; cast sadece burada
+            pcd.points = o3d.utility.Vector3dVector(pts.astype(np.float64))
             if cols is not None and cols.shape[0] == pts.shape[0]:
-                pcd.colors = o3d.utility.Vector3dVector(cols)
+                pcd.colors = o3d.utility.Vector3dVector(cols.astype(np.float64))
 
             # downsample + denoise
             pcd = pcd.voxel_down_sample(voxel_size=0.003)
@@ -753,17 +1239,20 @@ class ReconstructionWorker(BaseWorker):
             mesh.remove_non_manifold_edges()
             mesh.compute_vertex_normals()
 
-            mesh_ply = os.path.join(out_dir, "mesh.ply")
-            o3d.io.write_triangle_mesh(mesh_ply, mesh)
-            self.signals.log.emit(f"💾 Mesh PLY: {mesh_ply}")
+            # PLY + OBJ + STL: birbirinden bağımsız disk yazımları -> paralel (mesh sadece okunuyor)
+            from concurrent.futures import ThreadPoolExecutor
 
-            # OBJ + STL
+            mesh_ply = os.path.join(out_dir, "mesh.ply")
             mesh_obj = os.path.join(out_dir, "mesh.obj")
             mesh_stl = os.path.join(out_dir, "mesh.stl")
-            o3d.io.write_triangle_mesh(mesh_obj, mesh)
-            o3d.io.write_triangle_mesh(mesh_stl, mesh)
-            self.signals.log.emit(f"💾 OBJ: {mesh_obj}")
-            self.signals.log.emit(f"💾 STL: {mesh_stl}")
+            with ThreadPoolExecutor(max_workers=3) as ex:
+                futs = [ex.submit(o3d.io.write_triangle_mesh, fp, mesh) for fp in (mesh_ply, mesh_obj, mesh_stl)]
+                ok_ply, ok_obj, ok_stl = [f.result() for f in futs]
+            if not ok_ply:
+                raise RuntimeError(f"Mesh PLY yazılamadı: {mesh_ply}")
+            self.signals.log.emit(f"💾 Mesh PLY: {mesh_ply}")
+            self.signals.log.emit(f"💾 OBJ: {mesh_obj}" if ok_obj else f"⚠️ OBJ yazılamadı: {mesh_obj}")
+            self.signals.log.emit(f"💾 STL: {mesh_stl}" if ok_stl else f"⚠️ STL yazılamadı: {mesh_stl}")
 
             return mesh_ply
         except Exception as e:
@@ -771,21 +1260,46 @@ class ReconstructionWorker(BaseWorker):
             return ply_pc
 
     def _write_ply_points(self, filepath: str, pts: np.ndarray, cols: np.ndarray) -> None:
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write("ply\nformat ascii 1.0\n")
-            f.write(f"element vertex {pts.shape[0]}\n")
-            f.write("property float x\nproperty float y\nproperty float z\n")
-            has_color = cols is not None and cols.shape[0] == pts.shape[0]
+        pts = np.asarray(pts, np.float32)  # zaten float32 ise kopya yok
+        has_color = cols is not None and cols.shape[0] == pts.shape[0]
+        if has_color:
+            # tek float32 temp üzerinde yerinde çarp + kırp, sonra uint8
+            c255 = np.multiply(cols, np.float32(255.0), dtype=np.float32)
+            np.clip(c255, 0, 255, out=c255)
+            c255 = c255.astype(np.uint8)
+
+        header = "ply\n"
+        header += "format binary_little_endian 1.0\n" if self.binary_ply else "format ascii 1.0\n"
+        header += f"element vertex {pts.shape[0]}\n"
+        header += "property float x\nproperty float y\nproperty float z\n"
+        if has_color:
+            header += "property uchar red\nproperty uchar green\nproperty uchar blue\n"
+        header += "end_header\n"
+
+        if self.binary_ply:
+            # binary PLY: kayıtlar tek structured dizi, tek tofile (formatlama/parse yok)
+            fields = [("x", "<f4"), ("y", "<f4"), ("z", "<f4")]
             if has_color:
-                f.write("property uchar red\nproperty uchar green\nproperty uchar blue\n")
-            f.write("end_header\n")
+                fields += [("red", "u1"), ("green", "u1"), ("blue", "u1")]
+            rec = np.empty(pts.shape[0], dtype=fields)
+            rec["x"], rec["y"], rec["z"] = pts[:, 0], pts[:, 1], pts[:, 2]
             if has_color:
-                c255 = np.clip(cols * 255.0, 0, 255).astype(np.uint8)
-                for p, c in zip(pts, c255):
-                    f.write(f"{p[0]} {p[1]} {p[2]} {int(c[0])} {int(c[1])} {int(c[2])}\n")
-            else:
-                for p in pts:
-                    f.write(f"{p[0]} {p[1]} {p[2]}\n")
+                rec["red"], rec["green"], rec["blue"] = c255[:, 0], c255[:, 1], c255[:, 2]
+            with open(filepath, "wb", buffering=1 << 20) as f:
+                f.write(header.encode("ascii"))
+                rec.tofile(f)
+            return
+
+        # ASCII: gövde tek bir bytes buffer'da üretilir (satır başı Python write yok)
+        body = io.BytesIO()
+        if has_color:
+            np.savetxt(body, np.hstack([pts, c255]), fmt=["%.7g"] * 3 + ["%d"] * 3)
+        else:
+            np.savetxt(body, pts, fmt="%.7g")
+
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            f.write(header.encode("ascii"))
+            f.write(body.getbuffer())
 
 
 # ========================= Download Worker =========================
@@ -821,6 +1335,58 @@ class DownloadWorker(BaseWorker):
 
 
 # ========================= Viewer helper (separate process) =========================
+def _ply_face_count(model_path: str) -> int:
+    """PLY header'ından face sayısını oku (gövde okunmaz). Okunamazsa 0."""
+    try:
+        with open(model_path, "rb") as f:
+            for raw in f:
+                line = raw.strip()
+                if line == b"end_header":
+                    break
+                parts = line.split()
+                if len(parts) == 3 and parts[0] == b"element" and parts[1] == b"face":
+                    return int(parts[2])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+# Viewer'a gönderilen mesh üst sınırı; üzerindeki mesh'ler gösterim için bir kez sadeleştirilir
+# (diskteki çıktı dosyaları değişmez).
+VIEW_MAX_TRIANGLES = 200_000
+VIEW_MAX_POINTS = 2_000_000
+
+
+def _view_mesh(mesh):
+    """Büyük mesh'i gösterim için quadric decimation ile VIEW_MAX_TRIANGLES'a indir."""
+    if len(mesh.triangles) <= VIEW_MAX_TRIANGLES:
+        return mesh
+    low = mesh.simplify_quadric_decimation(target_number_of_triangles=VIEW_MAX_TRIANGLES)
+    low.compute_vertex_normals()
+    return low
+
+
+def _view_points(pcd):
+    """Çok büyük point cloud'u gösterim için her k'ıncı noktayı alarak VIEW_MAX_POINTS'e indir."""
+    n = len(pcd.points)
+    if n <= VIEW_MAX_POINTS:
+        return pcd
+    return pcd.uniform_down_sample(every_k_points=-(-n // VIEW_MAX_POINTS))
+
+
+def _load_view_geometry(o3d, model_path: str):
+    """PLY/OBJ/STL -> Open3D geometry (ply mesh değilse point cloud). Desteklenmezse None."""
+    low = model_path.lower()
+    if low.endswith(".ply"):
+        # ply mesh veya point cloud olabilir; header'a bakıp doğru reader ile tek seferde oku
+        if _ply_face_count(model_path) > 0:
+            return _view_mesh(o3d.io.read_triangle_mesh(model_path))
+        return _view_points(o3d.io.read_point_cloud(model_path))
+    if low.endswith(".obj") or low.endswith(".stl"):
+        return _view_mesh(o3d.io.read_triangle_mesh(model_path))
+    return None
+
+
 def run_viewer(model_path: str) -> int:
     """
     Open3D viewer'ı UI'dan bağımsız çalıştır.
@@ -828,21 +1394,9 @@ def run_viewer(model_path: str) -> int:
     """
     try:
         import open3d as o3d  # noqa
-        geom = None
-        if model_path.lower().endswith(".ply"):
-            # ply mesh veya point cloud olabilir
-            mesh = o3d.io.read_triangle_mesh(model_path)
-            if len(mesh.vertices) > 0 and len(mesh.triangles) > 0:
-                geom = mesh
-            else:
-                pcd = o3d.io.read_point_cloud(model_path)
-                geom = pcd
-        elif model_path.lower().endswith(".obj") or model_path.lower().endswith(".stl"):
-            mesh = o3d.io.read_triangle_mesh(model_path)
-            geom = mesh
-        else:
+        if not model_path.lower().endswith((".ply", ".obj", ".stl")):
             return 2
-
+        geom = _load_view_geometry(o3d, model_path)
         if geom is None:
             return 3
         o3d.visualization.draw_geometries([geom], window_name="AntaresStudio - Open3D Viewer")
@@ -851,7 +1405,62 @@ def run_viewer(model_path: str) -> int:
         return 1
 
 
+def run_viewer_loop(conn) -> None:
+    """
+    Kalıcı viewer process'i: Open3D bir kez import edilir, pencere açık kalır.
+    Pipe'tan gelen her model path'i mevcut pencerede gösterilir; None gelirse çıkılır.
+    """
+    try:
+        import open3d as o3d  # noqa
+    except Exception:
+        return
+    vis = None
+    try:
+        while True:
+            # pencere yokken bir sonraki path'i bekle; varken render döngüsünü çevir
+            if conn.poll(0.01 if vis is not None else None):
+                model_path = conn.recv()
+                if model_path is None:
+                    break
+                try:
+                    geom = _load_view_geometry(o3d, model_path)
+                except Exception:
+                    geom = None
+                if geom is not None:
+                    if vis is None:
+                        vis = o3d.visualization.Visualizer()
+                        vis.create_window(window_name="AntaresStudio - Open3D Viewer")
+                    vis.clear_geometries()
+                    vis.add_geometry(geom)
+                    vis.reset_view_point(True)
+            if vis is not None:
+                if vis.poll_events():
+                    vis.update_renderer()
+                else:
+                    # kullanıcı pencereyi kapattı; process açık kalır, sonraki path'te yeniden açılır
+                    vis.destroy_window()
+                    vis = None
+    except (EOFError, OSError):
+        pass
+    finally:
+        if vis is not None:
+            vis.destroy_window()
+
+
 # ========================= Main GUI =========================
+# Yardım sekmesi içeriği; sekme ilk açıldığında yüklenir.
+_HELP_HTML = """
+<h2 style="color:#38bdf8;">AntaresStudio - Notlar</h2>
+<ul>
+  <li><b>ESP32 endpointleri:</b> /360_list ve /360_SESSION_INDEX.jpg</li>
+  <li><b>Session ID</b> ESP32 tarafında <i>millis()</i> olduğundan tarih gibi gösterilmez.</li>
+  <li><b>Arkaplan temizleme:</b> Varsayılan GrabCut hızlıdır. Düz fonda Otsu çok daha hızlıdır. rembg ve U²-Net (ONNX, batch) opsiyoneldir.</li>
+  <li><b>Kalite:</b> quality -> SIFT varsa; speed -> ORB; balanced -> SIFT yoksa AKAZE.</li>
+  <li><b>Gerçek fotogrametri kalitesi</b> için COLMAP önerilir. Bu pipeline hafif SfM’dır.</li>
+</ul>
+"""
+
+
 class AntaresStudio(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -866,6 +1475,10 @@ class AntaresStudio(QMainWindow):
         self.output_model: Optional[str] = None
         self.current_out_dir: Optional[str] = None
 
+        # kalıcı Open3D viewer process'i (ilk açılışta başlatılır)
+        self._viewer_proc: Optional[multiprocessing.Process] = None
+        self._viewer_conn = None
+
         self._build_ui()
 
     # ---------------- UI ----------------
@@ -877,7 +1490,7 @@ class AntaresStudio(QMainWindow):
         header = QLabel("🚀 ANTARES - AntaresStudio (3D)")
         header.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header.setStyleSheet("color:#38bdf8; padding:14px;")
+        header.setObjectName("appHeader")
         main.addWidget(header)
 
         self.tabs = QTabWidget()
@@ -886,7 +1499,8 @@ class AntaresStudio(QMainWindow):
         self.tabs.addTab(self._tab_download(), "📥 ESP32 Download")
         self.tabs.addTab(self._tab_recon(), "🏗️ 3D Pipeline")
         self.tabs.addTab(self._tab_viewer(), "👁️ Viewer")
-        self.tabs.addTab(self._tab_help(), "ℹ️ Yardım")
+        self._help_tab_index = self.tabs.addTab(self._tab_help(), "ℹ️ Yardım")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
     def _tab_download(self) -> QWidget:
         w = QWidget()
@@ -990,7 +1604,7 @@ class AntaresStudio(QMainWindow):
 
         l.addWidget(QLabel("Yöntem:"), 6, 0)
         self.cmb_bg = QComboBox()
-        self.cmb_bg.addItems([GrabCutFast.name, RembgRemove.name])
+        self.cmb_bg.addItems([OtsuMaskRemove.name, GrabCutFast.name, RembgRemove.name, U2NetRemove.name])
         self.cmb_bg.setCurrentText(GrabCutFast.name)
         l.addWidget(self.cmb_bg, 6, 1)
 
@@ -1036,7 +1650,7 @@ class AntaresStudio(QMainWindow):
             "Open3D varsa ayrı bir viewer penceresi açılır (UI kilitlenmez)."
         )
         info.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        info.setStyleSheet("padding:18px;")
+        info.setObjectName("viewerInfo")
         lay.addWidget(info)
 
         self.btn_view = QPushButton("👁️ Open3D Viewer Aç")
@@ -1059,21 +1673,16 @@ class AntaresStudio(QMainWindow):
     def _tab_help(self) -> QWidget:
         w = QWidget()
         lay = QVBoxLayout(w)
-        txt = QTextEdit()
-        txt.setReadOnly(True)
-        txt.setHtml("""
-        <h2 style="color:#38bdf8;">AntaresStudio - Notlar</h2>
-        <ul>
-          <li><b>ESP32 endpointleri:</b> /360_list ve /360_SESSION_INDEX.jpg</li>
-          <li><b>Session ID</b> ESP32 tarafında <i>millis()</i> olduğundan tarih gibi gösterilmez.</li>
-          <li><b>Arkaplan temizleme:</b> Varsayılan GrabCut hızlıdır. rembg opsiyoneldir.</li>
-          <li><b>Kalite:</b> quality -> SIFT varsa; speed -> ORB; balanced -> SIFT yoksa AKAZE.</li>
-          <li><b>Gerçek fotogrametri kalitesi</b> için COLMAP önerilir. Bu pipeline hafif SfM’dır.</li>
-        </ul>
-        """)
-        lay.addWidget(txt)
+        # İçerik (_HELP_HTML) _on_tab_changed içinde ilk gösterimde yüklenir.
+        self.txt_help = QTextEdit()
+        self.txt_help.setReadOnly(True)
+        lay.addWidget(self.txt_help)
         return w
 
+    def _on_tab_changed(self, index: int) -> None:
+        if index == self._help_tab_index and self.txt_help.document().isEmpty():
+            self.txt_help.setHtml(_HELP_HTML)
+
     # ---------------- UI helpers ----------------
     def ui_log(self, box: QTextEdit, msg: str) -> None:
         box.append(msg)
@@ -1104,8 +1713,12 @@ class AntaresStudio(QMainWindow):
                 self.ui_log(self.log_dl, "⚠️ Tarama yok (veya SD boş).")
                 return
             # NOT: session_id millis -> tarih üretme yok
-            for sid, cnt in data.items():
-                self.list_scans.addItem(f"Session: {sid} | 📸 {cnt}")
+            # tek addItems çağrısı + repaint kapalı: satır başına layout/paint yok
+            self.list_scans.setUpdatesEnabled(False)
+            try:
+                self.list_scans.addItems([f"Session: {sid} | 📸 {cnt}" for sid, cnt in data.items()])
+            finally:
+                self.list_scans.setUpdatesEnabled(True)
             self.ui_log(self.log_dl, f"✅ {len(data)} session bulundu")
         except UserFacingError as e:
             self.show_error(e.title, e.message, e.details or e.hint)
@@ -1169,7 +1782,9 @@ class AntaresStudio(QMainWindow):
             return
         # jpg/png topla
         exts = (".jpg", ".jpeg", ".png")
-        imgs = [os.path.join(folder, f) for f in sorted(os.listdir(folder)) if f.lower().endswith(exts)]
+        # tek scandir geçişi: dirent tipi ile klasörler elenir, ek stat yok
+        with os.scandir(folder) as it:
+            imgs = sorted(e.path for e in it if e.name.lower().endswith(exts) and e.is_file())
         self.downloaded_images = imgs
         self.current_out_dir = os.path.join(folder, "3d_output")
         self.ui_log(self.log_3d, f"📁 Manuel klasör seçildi: {folder}")
@@ -1198,11 +1813,15 @@ class AntaresStudio(QMainWindow):
                 strat: BackgroundRemovalStrategy
                 if self.cmb_bg.currentText() == RembgRemove.name:
                     strat = RembgRemove()
+                elif self.cmb_bg.currentText() == U2NetRemove.name:
+                    strat = U2NetRemove()
+                elif self.cmb_bg.currentText() == OtsuMaskRemove.name:
+                    strat = OtsuMaskRemove()
                 else:
                     strat = GrabCutFast()
             except UserFacingError as e:
                 # fallback to GrabCut
-                self.ui_log(self.log_3d, f"⚠️ rembg yok -> GrabCut’a düşüyorum. ({e.hint})")
+                self.ui_log(self.log_3d, f"⚠️ {e.title} -> GrabCut’a düşüyorum. ({e.hint})")
                 strat = GrabCutFast()
 
             w = BackgroundRemoveWorker(images_to_use, clean_dir, strat)
@@ -1277,10 +1896,17 @@ class AntaresStudio(QMainWindow):
         if not self.output_model or not os.path.exists(self.output_model):
             return
 
-        # Open3D viewer'ı ayrı process olarak aç
+        # Open3D viewer'ı ayrı (kalıcı) process'te aç; sonraki açılışlarda sadece path gönderilir
         try:
-            p = subprocess.Popen([sys.executable, __file__, "--viewer", self.output_model])
-            self.ui_log(self.log_3d, f"👁️ Viewer process başlatıldı (pid={p.pid})")
+            if self._viewer_proc is None or not self._viewer_proc.is_alive():
+                # spawn: canlı QApplication/thread pool'u fork'lamadan temiz interpreter'da GL penceresi aç
+                ctx = multiprocessing.get_context("spawn")
+                parent_conn, child_conn = ctx.Pipe()
+                self._viewer_proc = ctx.Process(target=run_viewer_loop, args=(child_conn,), daemon=True)
+                self._viewer_proc.start()
+                self._viewer_conn = parent_conn
+                self.ui_log(self.log_3d, f"👁️ Viewer process başlatıldı (pid={self._viewer_proc.pid})")
+            self._viewer_conn.send(self.output_model)
         except Exception:
             # fallback: default OS open
             try:
@@ -1310,10 +1936,12 @@ def main():
 
     app = QApplication(sys.argv)
     apply_dark_industrial_theme(app)
+    apply_app_styles(app)
     win = AntaresStudio()
     win.show()
     return app.exec()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller EXE içinde viewer process'i için
     raise SystemExit(main())
@@ -12,6 +12,7 @@ PKGS = [
     ("open3d (optional)", "open3d"),
     ("rembg (optional)", "rembg"),
     ("onnxruntime (optional)", "onnxruntime"),
+    ("faiss (optional)", "faiss"),
 ]
 
 def try_import(modname: str):
@@ -41,7 +42,7 @@ def main():
             print(f"[OK]   {label}: {ver}")
         else:
             print(f"[MISS] {label}: {err}")
-            # open3d/rembg/onnxruntime optional
+            # open3d/rembg/onnxruntime/faiss optional
             if "optional" not in label:
                 all_ok = False
 